@@ -1,16 +1,37 @@
+from decimal import Decimal
+
+import orjson
 from flask import Flask
+from flask.json.provider import JSONProvider
 from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
 
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC
+
+
+def orjson_default(obj):
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError
+
+
+class ORJSONProvider(JSONProvider):
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=orjson_default, option=ORJSON_OPTIONS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 db = SQLAlchemy()
 migrate = Migrate()
 
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 
 app.config.from_pyfile("config.py", silent=False)
 
 db.init_app(app)
 migrate.init_app(app, db)
 
-from app import views 
-from app import models 
\ No newline at end of file
+from app import views
\ No newline at end of file
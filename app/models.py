@@ -13,6 +13,8 @@ class User(db.Model):
         "Record",
         back_populates="user",
         cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",
     )
 
     account = db.relationship(
@@ -20,6 +22,7 @@ class User(db.Model):
         back_populates="user",
         uselist=False,
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
     def __repr__(self) -> str:
@@ -36,6 +39,8 @@ class Category(db.Model):
         "Record",
         back_populates="category",
         cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",
     )
 
     def __repr__(self) -> str:
@@ -46,6 +51,15 @@ class Record(db.Model):
     
 
     __tablename__ = "records"
+    __table_args__ = (
+        db.Index(
+            "ix_records_user_cat_created",
+            "user_id",
+            "category_id",
+            "created_at",
+        ),
+        db.Index("ix_records_category", "category_id"),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
 
@@ -71,8 +85,18 @@ class Record(db.Model):
         nullable=False,
     )
 
-    user = db.relationship("User", back_populates="records")
-    category = db.relationship("Category", back_populates="records")
+    user = db.relationship(
+        "User",
+        back_populates="records",
+        lazy="joined",
+        innerjoin=True,
+    )
+    category = db.relationship(
+        "Category",
+        back_populates="records",
+        lazy="joined",
+        innerjoin=True,
+    )
 
     def __repr__(self) -> str:
         return (
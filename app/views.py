@@ -1,26 +1,93 @@
+import time
 from datetime import datetime, timezone
-from decimal import Decimal
+from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
 
-from flask import jsonify, request
+import orjson
+from flask import g, jsonify, request
 
-from app import app, db
+from app import app, db, orjson_default, ORJSON_OPTIONS
 from app.models import User, Category, Record, Account
 
 # Healthcheck
 
+HEALTHCHECK_TTL = 1.0
+
+# [rendered at (monotonic seconds), response body]
+_healthcheck_cache = [float("-inf"), b""]
+
+
 @app.get("/healthcheck")
 def healthcheck():
-    return jsonify({
-        "status": "ok",
-        "date": datetime.now(timezone.utc).isoformat()
-    }), 200
+    now = time.monotonic()
+    rendered_at, body = _healthcheck_cache
+    if now - rendered_at > HEALTHCHECK_TTL:
+        body = orjson.dumps({
+            "status": "ok",
+            "date": datetime.now(timezone.utc).isoformat()
+        })
+        _healthcheck_cache[:] = [now, body]
+    return app.response_class(body, mimetype="application/json")
 
 # Helpers
 
+TWO_PLACES = Decimal("0.01")
+EMPTY_LIST_JSON = b"[]"
+DELETED_JSON = orjson.dumps({"status": "deleted"})
+
+
 def error_response(message: str, status_code: int = 400):
     return jsonify({"error": message}), status_code
 
 
+def request_now() -> datetime:
+    # One timestamp per request, kept as a datetime: orjson formats it.
+    now = getattr(g, "now", None)
+    if now is None:
+        now = g.now = datetime.now(timezone.utc)
+    return now
+
+
+def read_json() -> dict | None:
+    raw = request.get_data(cache=False)
+    if not raw:
+        return {}
+    try:
+        data = orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def parse_amount(value) -> Decimal | None:
+    # Amounts are stored as Numeric(.., 2): build the Decimal once, already
+    # rounded the way the column would round it.
+    if isinstance(value, bool):
+        return None
+    try:
+        amount = Decimal(str(value))
+        if not amount.is_finite():
+            return None
+        return amount.quantize(TWO_PLACES, rounding=ROUND_HALF_UP)
+    except InvalidOperation:
+        return None
+
+
+def json_response(payload, status_code: int = 200):
+    return app.response_class(
+        orjson.dumps(payload, default=orjson_default, option=ORJSON_OPTIONS),
+        status=status_code,
+        mimetype="application/json",
+    )
+
+
+def empty_list_response():
+    return app.response_class(EMPTY_LIST_JSON, mimetype="application/json")
+
+
+def deleted_response():
+    return app.response_class(DELETED_JSON, mimetype="application/json")
+
+
 def user_to_dict(user: User) -> dict:
     return {
         "id": user.id,
@@ -40,11 +107,23 @@ def record_to_dict(record: Record) -> dict:
         "id": record.id,
         "user_id": record.user_id,
         "category_id": record.category_id,
-        "created_at": record.created_at.isoformat() if record.created_at else None,
+        "created_at": record.created_at,
         "amount": float(record.amount) if record.amount is not None else None,
     }
 
 
+def get_account_for_update(user_id: int) -> Account | None:
+    # Row lock held until commit: the balance check and the debit must not
+    # interleave with another request for the same account.
+    query = (
+        db.select(Account)
+        .where(Account.user_id == user_id)
+        .with_for_update()
+        .execution_options(populate_existing=True)
+    )
+    return db.session.execute(query).scalar_one_or_none()
+
+
 def account_to_dict(account: Account) -> dict:
     return {
         "id": account.id,
@@ -64,19 +143,20 @@ def get_user(user_id: int):
 
 @app.delete("/user/<int:user_id>")
 def delete_user(user_id: int):
-    user = User.query.get(user_id)
-    if user is None:
-        return error_response("User not found", 404)
-
-    db.session.delete(user)
+    result = db.session.execute(db.delete(User).where(User.id == user_id))
     db.session.commit()
 
-    return jsonify({"status": "deleted"}), 200
+    if result.rowcount == 0:
+        return error_response("User not found", 404)
+
+    return deleted_response()
 
 
 @app.post("/user")
 def create_user():
-    data = request.get_json(silent=True) or {}
+    data = read_json()
+    if data is None:
+        return error_response("Invalid JSON")
 
     name = data.get("name")
     if not name:
@@ -91,8 +171,11 @@ def create_user():
 
 @app.get("/users")
 def list_users():
-    all_users = User.query.order_by(User.id.asc()).all()
-    return jsonify([user_to_dict(u) for u in all_users]), 200
+    query = db.select(User.id, User.name).order_by(User.id.asc())
+    result = [r._asdict() for r in db.session.execute(query)]
+    if not result:
+        return empty_list_response()
+    return json_response(result)
 
 
 # ACCOUNTS 
@@ -118,27 +201,28 @@ def deposit_to_account(user_id: int):
     if user is None:
         return error_response("User not found", 404)
 
-    data = request.get_json(silent=True) or {}
+    data = read_json()
+    if data is None:
+        return error_response("Invalid JSON")
 
     if "amount" not in data:
         return error_response("Field 'amount' is required")
 
-    try:
-        amount_value = float(data["amount"])
-    except (TypeError, ValueError):
+    amount_dec = parse_amount(data["amount"])
+    if amount_dec is None:
         return error_response("Field 'amount' must be a number")
 
-    if amount_value <= 0:
+    if amount_dec <= 0:
         return error_response("Field 'amount' must be positive")
 
-    amount_dec = Decimal(str(amount_value))
-
     account = user.account
     if account is None:
         account = Account(user_id=user.id, balance=Decimal("0"))
         db.session.add(account)
+        db.session.flush()
 
-    account.balance = (account.balance or Decimal("0")) + amount_dec
+    # Increment in SQL so concurrent deposits cannot overwrite each other.
+    account.balance = Account.balance + amount_dec
     db.session.commit()
 
     return jsonify(account_to_dict(account)), 200
@@ -147,13 +231,18 @@ def deposit_to_account(user_id: int):
 
 @app.get("/category")
 def list_categories():
-    categories = Category.query.order_by(Category.id.asc()).all()
-    return jsonify([category_to_dict(c) for c in categories]), 200
+    query = db.select(Category.id, Category.name).order_by(Category.id.asc())
+    result = [r._asdict() for r in db.session.execute(query)]
+    if not result:
+        return empty_list_response()
+    return json_response(result)
 
 
 @app.post("/category")
 def create_category():
-    data = request.get_json(silent=True) or {}
+    data = read_json()
+    if data is None:
+        return error_response("Invalid JSON")
 
     name = data.get("name")
     if not name:
@@ -176,17 +265,21 @@ def delete_category():
     if category_id is None:
         return error_response("Query parameter 'id' is required")
 
-    category = Category.query.get(category_id)
-    if category is None:
-        return error_response("Category not found", 404)
-
-    db.session.delete(category)
+    result = db.session.execute(
+        db.delete(Category).where(Category.id == category_id)
+    )
     db.session.commit()
 
-    return jsonify({"status": "deleted"}), 200
+    if result.rowcount == 0:
+        return error_response("Category not found", 404)
+
+    return deleted_response()
 
 # RECORDS 
 
+RECORD_REQUIRED_FIELDS = ("user_id", "category_id", "amount")
+
+
 @app.get("/record/<int:record_id>")
 def get_record(record_id: int):
     record = Record.query.get(record_id)
@@ -204,39 +297,38 @@ def delete_record(record_id: int):
     db.session.delete(record)
     db.session.commit()
 
-    return jsonify({"status": "deleted"}), 200
+    return deleted_response()
 
 
 @app.post("/record")
 def create_record():
-    data = request.get_json(silent=True) or {}
+    data = read_json()
+    if data is None:
+        return error_response("Invalid JSON")
 
-    required_fields = ["user_id", "category_id", "amount"]
-    missing = [f for f in required_fields if f not in data]
-    if missing:
+    try:
+        user_id = data["user_id"]
+        category_id = data["category_id"]
+        raw_amount = data["amount"]
+    except KeyError:
+        missing = [f for f in RECORD_REQUIRED_FIELDS if f not in data]
         return error_response(f"Missing fields: {', '.join(missing)}")
 
-    user_id = data["user_id"]
-    category_id = data["category_id"]
+    amount_dec = parse_amount(raw_amount)
+    if amount_dec is None:
+        return error_response("Field 'amount' must be a number")
+
+    if amount_dec <= 0:
+        return error_response("Field 'amount' must be positive")
 
-    user = User.query.get(user_id)
+    user = db.session.get(User, user_id)
     if user is None:
         return error_response("User does not exist")
 
-    category = Category.query.get(category_id)
+    category = db.session.get(Category, category_id)
     if category is None:
         return error_response("Category does not exist")
 
-    try:
-        amount_value = float(data["amount"])
-    except (TypeError, ValueError):
-        return error_response("Field 'amount' must be a number")
-
-    if amount_value <= 0:
-        return error_response("Field 'amount' must be positive")
-
-    amount_dec = Decimal(str(amount_value))
-
     created_at_str = data.get("created_at")
     if created_at_str:
         try:
@@ -246,9 +338,9 @@ def create_record():
         except ValueError:
             return error_response("Field 'created_at' must be valid ISO datetime")
     else:
-        created_at = datetime.now(timezone.utc)
+        created_at = request_now()
 
-    account = user.account
+    account = get_account_for_update(user.id)
     if account is None:
         account = Account(user_id=user.id, balance=Decimal("0"))
         db.session.add(account)
@@ -271,7 +363,7 @@ def create_record():
     db.session.add(record)
     db.session.commit()
 
-    return jsonify(record_to_dict(record)), 201
+    return json_response(record_to_dict(record), 201)
 
 
 @app.get("/record")
@@ -282,12 +374,27 @@ def list_records():
     if user_id is None and category_id is None:
         return error_response("At least one of 'user_id' or 'category_id' must be provided")
 
-    query = Record.query
+    # Ids come from sequences starting at 1: nothing can match, skip the query.
+    if (user_id is not None and user_id < 1) or (category_id is not None and category_id < 1):
+        return empty_list_response()
+
+    query = db.select(
+        Record.id,
+        Record.user_id,
+        Record.category_id,
+        Record.created_at,
+        Record.amount,
+    )
 
     if user_id is not None:
-        query = query.filter(Record.user_id == user_id)
+        query = query.where(Record.user_id == user_id)
     if category_id is not None:
-        query = query.filter(Record.category_id == category_id)
-
-    records = query.order_by(Record.id.asc()).all()
-    return jsonify([record_to_dict(r) for r in records]), 200
+        query = query.where(Record.category_id == category_id)
+
+    query = query.order_by(Record.created_at.asc(), Record.id.asc())
+    # Rows already carry the response keys; amount (Decimal) is converted
+    # by orjson_default.
+    result = [r._asdict() for r in db.session.execute(query)]
+    if not result:
+        return empty_list_response()
+    return json_response(result)
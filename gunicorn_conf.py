@@ -0,0 +1,19 @@
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8080')}"
+
+workers = int(os.environ.get("WEB_CONCURRENCY", "2"))
+worker_class = "gthread"
+threads = int(os.environ.get("GUNICORN_THREADS", "4"))
+
+# Import the app once in the master; workers share its memory copy-on-write.
+# All mutable state lives in PostgreSQL, so nothing diverges between workers.
+preload_app = True
+
+
+def post_fork(server, worker):
+    # Do not reuse pooled connections inherited from the master process.
+    from app import app, db
+
+    with app.app_context():
+        db.engine.dispose(close=False)